@@ -13,12 +13,82 @@ import re
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+
+try:
+    import orjson  # Optional, much faster JSON encoding when installed
+except ImportError:
+    orjson = None
+
+# Domain keywords per category as (regex group name, category, keywords),
+# in priority order: a domain gets the first category with a matching keyword
+CATEGORY_KEYWORDS = (
+    ('dev', "Development & Tech", (
+        'github', 'stackoverflow', 'dev.to', 'medium', 'hackernews',
+        'reddit.com/r/programming', 'docs.', 'api.', 'developer'
+    )),
+    ('learning', "Learning & Education", (
+        'coursera', 'udemy', 'pluralsight', 'youtube', 'khan',
+        'edx', 'harvard', 'mit', 'university'
+    )),
+    ('work', "Work & Productivity", (
+        'slack', 'notion', 'trello', 'jira', 'confluence',
+        'office', 'google.com/drive', 'dropbox'
+    )),
+    ('news', "News & Information", (
+        'news', 'bbc', 'cnn', 'reuters', 'techcrunch', 'ars-technica'
+    )),
+    ('social', "Social Media", (
+        'facebook', 'twitter', 'linkedin', 'instagram', 'tiktok'
+    )),
+    ('shopping', "Shopping", (
+        'amazon', 'ebay', 'shop', 'store', 'buy', 'market'
+    )),
+    ('entertainment', "Entertainment", (
+        'netflix', 'spotify', 'twitch', 'gaming', 'entertainment'
+    )),
+)
+
+# Title keywords that mark a page as Learning & Education
+LEARNING_TITLE_KEYWORDS = ('tutorial', 'course', 'learn', 'education')
+
+# One regex with a named group per category; each alternative lazily scans the
+# whole domain before the next one is tried, so the first category in
+# CATEGORY_KEYWORDS with any matching keyword wins, as with a chain of checks
+_CATEGORY_RE = re.compile('|'.join(
+    f"(?:.*?(?P<{group}>{'|'.join(map(re.escape, keywords))}))"
+    for group, _, keywords in CATEGORY_KEYWORDS
+), re.DOTALL)
+_GROUP_TO_CATEGORY = {group: category for group, category, _ in CATEGORY_KEYWORDS}
+
+# Case-insensitive, so titles need not be lowered (and copied) per URL;
+# domains are already lowercase from _extract_domain
+_LEARNING_TITLE_RE = re.compile('|'.join(map(re.escape, LEARNING_TITLE_KEYWORDS)), re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _domain_category_group(domain: str) -> Optional[str]:
+    """Regex group name of the domain's category, or None if no keyword matches"""
+    # Histories revisit the same few thousand domains, so each is matched only once
+    match = _CATEGORY_RE.match(domain)
+    return match.lastgroup if match else None
+
+# Visits are kept as tuples in this field order (a tuple is much smaller
+# than a dict) and only expanded to dicts when written out
+VISIT_FIELDS = ('visit_time', 'visit_timestamp', 'duration', 'transition', 'referrer')
 
 @dataclass
 class HistoryEntry:
     """Model for a browser history entry"""
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10+
+    __slots__ = (
+        'id', 'url', 'title', 'visit_count', 'typed_count', 'last_visit_time',
+        'last_visit_timestamp', 'domain', 'visits', 'total_visits', 'search_terms', 'category'
+    )
+    
     id: int
     url: str
     title: str
@@ -27,9 +97,29 @@ class HistoryEntry:
     last_visit_time: str  # ISO format
     last_visit_timestamp: int  # Original Chrome timestamp
     domain: str
-    visits: List[Dict[str, Any]]
+    visits: List[Tuple[str, int, int, int, str]]  # Positional, see VISIT_FIELDS
+    total_visits: int  # Visit rows for this URL, known even when visits are not loaded
     search_terms: List[str]
     category: str  # Will be determined by domain/URL patterns
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict of the entry's fields for output, with visits expanded to dicts"""
+        # Spelled out rather than looping over dataclasses.fields(): this runs
+        # for every entry on every serialization and token estimate. total_visits
+        # is left out as JSON output always carries the visits themselves.
+        return {
+            'id': self.id,
+            'url': self.url,
+            'title': self.title,
+            'visit_count': self.visit_count,
+            'typed_count': self.typed_count,
+            'last_visit_time': self.last_visit_time,
+            'last_visit_timestamp': self.last_visit_timestamp,
+            'domain': self.domain,
+            'visits': [dict(zip(VISIT_FIELDS, visit)) for visit in self.visits],
+            'search_terms': self.search_terms,
+            'category': self.category
+        }
 
 class ChunkingHelper:
     """Helper class for handling LLM-compatible chunking"""
@@ -77,84 +167,47 @@ class ChunkingHelper:
 class HistoryExtractor:
     """Main class for extracting browser history data"""
     
-    def __init__(self, db_path: str = "comet_history_temp.db"):
+    def __init__(self, db_path: str = "comet_history_temp.db", include_visits: bool = True):
         self.db_path = Path(db_path)
+        # Without visits, entries only carry per-URL visit counts (enough for the
+        # CSV and statistics) and the per-visit rows are never formatted or loaded
+        self.include_visits = include_visits
         self.history_entries: List[HistoryEntry] = []
     
-    def _chrome_timestamp_to_datetime(self, chrome_timestamp: int) -> str:
-        """Convert Chrome timestamp to ISO format datetime string"""
-        if chrome_timestamp == 0:
-            return ""
-        
-        # Chrome timestamps are microseconds since January 1, 1601
-        # Convert to Unix timestamp first
-        unix_timestamp = (chrome_timestamp - 11644473600000000) / 1000000
-        dt = datetime.fromtimestamp(unix_timestamp, tz=timezone.utc)
-        return dt.isoformat()
+    @staticmethod
+    def _chrome_timestamp_sql(column: str) -> str:
+        """SQL expression converting a Chrome timestamp column to an ISO format UTC string"""
+        # Chrome timestamps are microseconds since January 1, 1601. SQLite does the
+        # conversion while scanning, matching datetime.isoformat() output: fractional
+        # seconds only when non-zero, and an empty string for a zero timestamp.
+        return f"""CASE WHEN {column} = 0 THEN '' ELSE
+            strftime('%Y-%m-%dT%H:%M:%S', {column} / 1000000 - 11644473600, 'unixepoch')
+            || CASE WHEN {column} % 1000000 THEN printf('.%06d', {column} % 1000000) ELSE '' END
+            || '+00:00' END"""
     
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL"""
-        try:
-            if url.startswith(('http://', 'https://')):
-                return url.split('/')[2].lower()
-            return url.split('/')[0].lower()
-        except (IndexError, AttributeError):
-            return "unknown"
-    
-    def _categorize_url(self, url: str, title: str) -> str:
-        """Categorize URL based on domain and content patterns"""
-        domain = self._extract_domain(url)
-        url_lower = url.lower()
-        title_lower = title.lower()
-        
-        # Development & Tech
-        if any(keyword in domain for keyword in [
-            'github', 'stackoverflow', 'dev.to', 'medium', 'hackernews', 
-            'reddit.com/r/programming', 'docs.', 'api.', 'developer'
-        ]):
-            return "Development & Tech"
-        
-        # Learning & Education
-        if any(keyword in domain for keyword in [
-            'coursera', 'udemy', 'pluralsight', 'youtube', 'khan', 
-            'edx', 'harvard', 'mit', 'university'
-        ]) or any(keyword in title_lower for keyword in [
-            'tutorial', 'course', 'learn', 'education'
-        ]):
-            return "Learning & Education"
-        
-        # Work & Productivity
-        if any(keyword in domain for keyword in [
-            'slack', 'notion', 'trello', 'jira', 'confluence', 
-            'office', 'google.com/drive', 'dropbox'
-        ]):
-            return "Work & Productivity"
-        
-        # News & Information
-        if any(keyword in domain for keyword in [
-            'news', 'bbc', 'cnn', 'reuters', 'techcrunch', 'ars-technica'
-        ]):
-            return "News & Information"
-        
-        # Social Media
-        if any(keyword in domain for keyword in [
-            'facebook', 'twitter', 'linkedin', 'instagram', 'tiktok'
-        ]):
-            return "Social Media"
+        # Slice out the host directly instead of splitting the whole URL into a list
+        if url.startswith('https://'):
+            start = 8
+        elif url.startswith('http://'):
+            start = 7
+        else:
+            start = 0
         
-        # Shopping
-        if any(keyword in domain for keyword in [
-            'amazon', 'ebay', 'shop', 'store', 'buy', 'market'
-        ]):
-            return "Shopping"
+        end = url.find('/', start)
+        return (url[start:end] if end != -1 else url[start:]).lower()
+    
+    def _categorize_url(self, domain: str, title: str) -> str:
+        """Categorize URL based on its domain and content patterns"""
+        group = _domain_category_group(domain)
         
-        # Entertainment
-        if any(keyword in domain for keyword in [
-            'netflix', 'spotify', 'twitch', 'gaming', 'entertainment'
-        ]):
-            return "Entertainment"
+        # Learning content can also be recognised by its title, which takes
+        # precedence over every domain category except Development & Tech
+        if group not in ('dev', 'learning') and _LEARNING_TITLE_RE.search(title):
+            group = 'learning'
         
-        return "Other"
+        return _GROUP_TO_CATEGORY.get(group, "Other")
     
     def extract_data(self) -> bool:
         """Extract all history data from the database"""
@@ -164,72 +217,66 @@ class HistoryExtractor:
         
         try:
             conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
-            cursor = conn.cursor()
-            
-            print("🔍 Extracting URLs and basic info...")
-            
-            # Get all URLs with their basic information
-            cursor.execute("""
-                SELECT id, url, title, visit_count, typed_count, last_visit_time, hidden
-                FROM urls 
-                WHERE hidden = 0 AND url != ''
-                ORDER BY last_visit_time DESC
-            """)
-            
-            urls_data = cursor.fetchall()
-            print(f"📊 Found {len(urls_data)} URLs")
-            
-            # Create a mapping for efficient lookups
-            url_visits = defaultdict(list)
-            url_search_terms = defaultdict(list)
             
-            print("🔍 Extracting visit details...")
+            # Tune the connection for one big read-only scan: memory-map the file
+            # (256 MiB), use a 64 MiB page cache and keep sort b-trees in memory
+            for pragma in ("mmap_size=268435456", "cache_size=-65536",
+                           "temp_store=MEMORY", "query_only=1"):
+                conn.execute(f"PRAGMA {pragma}")
             
-            # Get all visits for each URL
-            cursor.execute("""
-                SELECT v.url, v.visit_time, v.visit_duration, v.transition, v.external_referrer_url
-                FROM visits v
-                ORDER BY v.visit_time DESC
-            """)
+            cursor = conn.cursor()
             
-            visits_data = cursor.fetchall()
-            print(f"📊 Found {len(visits_data)} visits")
-            
-            # Group visits by URL ID
-            for visit in visits_data:
-                url_id, visit_time, duration, transition, referrer = visit
-                url_visits[url_id].append({
-                    'visit_time': self._chrome_timestamp_to_datetime(visit_time),
-                    'visit_timestamp': visit_time,
-                    'duration': duration,
-                    'transition': transition,
-                    'referrer': referrer or ""
-                })
-            
-            print("🔍 Extracting search terms...")
-            
-            # Get search terms
-            cursor.execute("""
-                SELECT url_id, term
-                FROM keyword_search_terms
+            print("🔍 Extracting URLs with their visits and search terms...")
+            
+            if self.include_visits:
+                visits_table = f"""
+                    SELECT url, count(*) AS total_visits, json_group_array(json_array(
+                               {self._chrome_timestamp_sql('visit_time')},
+                               visit_time,
+                               visit_duration,
+                               transition,
+                               coalesce(external_referrer_url, ''))) AS visits_json
+                    FROM (SELECT * FROM visits ORDER BY url, visit_time DESC)
+                    GROUP BY url"""
+            else:
+                visits_table = """
+                    SELECT url, count(*) AS total_visits, '[]' AS visits_json
+                    FROM visits
+                    GROUP BY url"""
+            
+            # Get all URLs with their visits and search terms aggregated by SQLite,
+            # so Python receives one row per URL instead of one row per visit.
+            # Visits and search terms are each grouped in a single pass and joined
+            # in, which stays linear even on history copies without indexes.
+            # Rows come back sorted by last visit time (most recent first), with
+            # hidden and empty or whitespace-only URLs already filtered out.
+            cursor.execute(f"""
+                SELECT u.id, u.url, u.title, u.visit_count, u.typed_count, u.last_visit_time,
+                    {self._chrome_timestamp_sql('u.last_visit_time')} AS last_visit_iso,
+                    coalesce(v.visits_json, '[]') AS visits_json,
+                    coalesce(v.total_visits, 0) AS total_visits,
+                    coalesce(k.search_terms_json, '[]') AS search_terms_json
+                FROM urls u
+                LEFT JOIN ({visits_table}
+                ) v ON v.url = u.id
+                LEFT JOIN (
+                    SELECT url_id, json_group_array(term) AS search_terms_json
+                    FROM keyword_search_terms
+                    GROUP BY url_id
+                ) k ON k.url_id = u.id
+                WHERE u.hidden = 0 AND trim(u.url, char(9, 10, 11, 12, 13, 32)) != ''
+                ORDER BY u.last_visit_time DESC
             """)
             
-            search_terms_data = cursor.fetchall()
-            print(f"📊 Found {len(search_terms_data)} search terms")
-            
-            # Group search terms by URL ID
-            for url_id, term in search_terms_data:
-                url_search_terms[url_id].append(term)
-            
-            # Process all data into HistoryEntry objects
+            # Process rows into HistoryEntry objects as SQLite steps through them,
+            # rather than materializing the whole result set first
             print("⚙️  Processing data...")
             
-            for url_data in urls_data:
-                url_id, url, title, visit_count, typed_count, last_visit_time, hidden = url_data
+            for url_data in cursor:
+                (url_id, url, title, visit_count, typed_count, last_visit_time, last_visit_iso,
+                 visits_json, total_visits, search_terms_json) = url_data
                 
-                # Skip empty or invalid URLs
-                if not url or url.strip() == '':
-                    continue
+                domain = self._extract_domain(url)
                 
                 entry = HistoryEntry(
                     id=url_id,
@@ -237,21 +284,19 @@ class HistoryExtractor:
                     title=title or "No Title",
                     visit_count=visit_count,
                     typed_count=typed_count,
-                    last_visit_time=self._chrome_timestamp_to_datetime(last_visit_time),
+                    last_visit_time=last_visit_iso,
                     last_visit_timestamp=last_visit_time,
-                    domain=self._extract_domain(url),
-                    visits=url_visits.get(url_id, []),
-                    search_terms=url_search_terms.get(url_id, []),
-                    category=self._categorize_url(url, title or "")
+                    domain=domain,
+                    visits=list(map(tuple, json.loads(visits_json))),
+                    total_visits=total_visits,
+                    search_terms=json.loads(search_terms_json),
+                    category=self._categorize_url(domain, title or "")
                 )
                 
                 self.history_entries.append(entry)
             
             conn.close()
             
-            # Sort by last visit time (most recent first)
-            self.history_entries.sort(key=lambda x: x.last_visit_timestamp, reverse=True)
-            
             print(f"✅ Successfully processed {len(self.history_entries)} history entries")
             return True
             
@@ -262,21 +307,43 @@ class HistoryExtractor:
             print(f"❌ Unexpected error: {e}")
             return False
     
-    def save_to_json(self, filename: str = "comet_history.json") -> bool:
-        """Save history data to JSON file"""
+    @staticmethod
+    def _write_json(filename: str, data: Any) -> None:
+        """Write data as indented JSON, expanding any HistoryEntry objects via to_dict()"""
+        if orjson is not None:
+            # orjson writes straight to UTF-8 bytes, producing the same layout as
+            # json.dump(indent=2) many times faster
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    data, default=HistoryEntry.to_dict,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+                ))
+        else:
+            # The default hook turns entries into dicts one at a time while
+            # json.dump streams to the file
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=HistoryEntry.to_dict)
+    
+    def save_to_json(self, filename: str = "comet_history.json",
+                     summary: Optional[Dict[str, Any]] = None) -> bool:
+        """Save history data to JSON file, reusing a generate_summary() result if given"""
         try:
-            # Convert dataclasses to dictionaries
+            if summary:
+                categories = list(summary["categories"])
+            else:
+                categories = list(dict.fromkeys(entry.category for entry in self.history_entries))
+            
+            # Entries are passed as-is; no dict copy of the whole history is built
             data = {
                 "metadata": {
                     "total_entries": len(self.history_entries),
                     "extraction_date": datetime.now(timezone.utc).isoformat(),
-                    "categories": list(set(entry.category for entry in self.history_entries))
+                    "categories": categories
                 },
-                "history": [asdict(entry) for entry in self.history_entries]
+                "history": self.history_entries
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_json(filename, data)
             
             print(f"💾 JSON data saved to: {filename}")
             return True
@@ -288,7 +355,13 @@ class HistoryExtractor:
     def save_to_csv(self, filename: str = "comet_history.csv") -> bool:
         """Save history data to CSV file (flattened format)"""
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+            # Plain columns are read in one C-level attrgetter call per row
+            columns = attrgetter(
+                'id', 'url', 'title', 'domain', 'category',
+                'visit_count', 'typed_count', 'last_visit_time', 'total_visits'
+            )
+            
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 
                 # Write header
@@ -298,20 +371,11 @@ class HistoryExtractor:
                     'total_visits', 'search_terms'
                 ])
                 
-                # Write data
-                for entry in self.history_entries:
-                    writer.writerow([
-                        entry.id,
-                        entry.url,
-                        entry.title,
-                        entry.domain,
-                        entry.category,
-                        entry.visit_count,
-                        entry.typed_count,
-                        entry.last_visit_time,
-                        len(entry.visits),
-                        '; '.join(entry.search_terms)
-                    ])
+                # Write data; writerows drives the generator from C
+                writer.writerows(
+                    (*columns(entry), '; '.join(entry.search_terms))
+                    for entry in self.history_entries
+                )
             
             print(f"💾 CSV data saved to: {filename}")
             return True
@@ -320,24 +384,37 @@ class HistoryExtractor:
             print(f"❌ Error saving CSV: {e}")
             return False
     
+    def save_statistics(self, summary: Dict[str, Any],
+                        filename: str = "comet_history_statistics.json") -> bool:
+        """Save generate_summary() statistics to JSON file"""
+        try:
+            self._write_json(filename, summary)
+            
+            print(f"💾 Statistics saved to: {filename}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error saving statistics: {e}")
+            return False
+    
     def generate_summary(self) -> Dict[str, Any]:
         """Generate summary statistics"""
         if not self.history_entries:
             return {}
         
-        categories = defaultdict(int)
-        domains = defaultdict(int)
-        total_visits = 0
-        total_search_terms = 0
+        # Counter tallies the generators in C
+        categories = Counter(entry.category for entry in self.history_entries)
+        domains = Counter(entry.domain for entry in self.history_entries)
+        total_visits = sum(entry.total_visits for entry in self.history_entries)
+        total_search_terms = sum(len(entry.search_terms) for entry in self.history_entries)
         
-        for entry in self.history_entries:
-            categories[entry.category] += 1
-            domains[entry.domain] += 1
-            total_visits += len(entry.visits)
-            total_search_terms += len(entry.search_terms)
+        # Get top domains (heap-based, same order as a stable sort by count)
+        top_domains = domains.most_common(20)
         
-        # Get top domains
-        top_domains = sorted(domains.items(), key=lambda x: x[1], reverse=True)[:20]
+        # Entries are ordered most recent first by extract_data, and zero
+        # timestamps (empty times) sort last, so the range sits at the two ends
+        newest = self.history_entries[0].last_visit_time
+        oldest = next((e.last_visit_time for e in reversed(self.history_entries) if e.last_visit_time), "")
         
         return {
             "total_urls": len(self.history_entries),
@@ -346,8 +423,8 @@ class HistoryExtractor:
             "categories": dict(categories),
             "top_domains": dict(top_domains),
             "date_range": {
-                "oldest": min((e.last_visit_time for e in self.history_entries if e.last_visit_time), default=""),
-                "newest": max((e.last_visit_time for e in self.history_entries if e.last_visit_time), default="")
+                "oldest": oldest,
+                "newest": newest
             }
         }
     
@@ -367,12 +444,12 @@ class HistoryExtractor:
         # Base metadata structure for each chunk
         base_metadata = {
             "extraction_date": datetime.now(timezone.utc).isoformat(),
-            "categories": list(set(entry.category for entry in self.history_entries))
+            "categories": list(dict.fromkeys(entry.category for entry in self.history_entries))
         }
         
         for entry in self.history_entries:
             # Estimate tokens for this entry
-            entry_tokens = ChunkingHelper.estimate_tokens(asdict(entry))
+            entry_tokens = ChunkingHelper.estimate_tokens(entry.to_dict())
             
             # If this entry alone exceeds chunk limit, put it in its own chunk
             if entry_tokens > max_tokens_per_chunk:
@@ -384,7 +461,7 @@ class HistoryExtractor:
                         "total_entries": len(current_chunk),
                         "estimated_tokens": current_tokens
                     }
-                    chunks.append((current_chunk.copy(), chunk_metadata))
+                    chunks.append((current_chunk, chunk_metadata))
                     chunk_counter += 1
                     current_chunk = []
                     current_tokens = 0
@@ -409,7 +486,7 @@ class HistoryExtractor:
                     "total_entries": len(current_chunk),
                     "estimated_tokens": current_tokens
                 }
-                chunks.append((current_chunk.copy(), chunk_metadata))
+                chunks.append((current_chunk, chunk_metadata))
                 chunk_counter += 1
                 current_chunk = []
                 current_tokens = 0
@@ -438,24 +515,28 @@ class HistoryExtractor:
                    base_filename: str = "comet_history_chunk") -> bool:
         """Save chunked history data to multiple JSON files"""
         try:
-            saved_files = []
-            
-            for entries, metadata in chunks:
-                chunk_id = metadata["chunk_id"]
-                filename = f"{base_filename}_{chunk_id}.json"
+            def write_chunk(chunk: Tuple[List[HistoryEntry], Dict[str, Any]]) -> str:
+                entries, metadata = chunk
+                filename = f"{base_filename}_{metadata['chunk_id']}.json"
                 
                 # Create the chunk data structure
                 chunk_data = {
                     "chunk_info": metadata,
-                    "history": [asdict(entry) for entry in entries]
+                    "history": entries
                 }
                 
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(chunk_data, f, indent=2, ensure_ascii=False)
-                
-                saved_files.append(filename)
-                print(f"💾 Chunk {chunk_id}/{metadata['total_chunks']} saved to: {filename} "
-                      f"({metadata['total_entries']} entries, ~{metadata['estimated_tokens']:,} tokens)")
+                self._write_json(filename, chunk_data)
+                return filename
+            
+            saved_files = []
+            
+            # Chunks are independent files, so write several at once; map()
+            # yields results in chunk order, keeping the progress output ordered
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for (_, metadata), filename in zip(chunks, executor.map(write_chunk, chunks)):
+                    saved_files.append(filename)
+                    print(f"💾 Chunk {metadata['chunk_id']}/{metadata['total_chunks']} saved to: {filename} "
+                          f"({metadata['total_entries']} entries, ~{metadata['estimated_tokens']:,} tokens)")
             
             print(f"\n✅ All {len(chunks)} chunks saved successfully!")
             print("📁 Files created:")
@@ -478,16 +559,26 @@ Examples:
   python extract_comet_history.py                    # Default extraction (single file)
   python extract_comet_history.py --chunk-size 200k  # Split into 200k token chunks
   python extract_comet_history.py --chunk-size 1M    # Split into 1M token chunks
+  python extract_comet_history.py --csv-only         # Only the CSV and statistics (faster)
         '''
     )
     
-    parser.add_argument(
+    output_mode = parser.add_mutually_exclusive_group()
+    
+    output_mode.add_argument(
         '--chunk-size',
         type=str,
         help='Split output into chunks of specified token size (e.g., "200k", "1M"). '
              'If not specified, outputs a single file.'
     )
     
+    output_mode.add_argument(
+        '--csv-only',
+        action='store_true',
+        help='Only save the summary CSV and statistics, skipping the per-visit '
+             'details needed for JSON output (faster on large histories)'
+    )
+    
     parser.add_argument(
         '--db-path',
         type=str,
@@ -504,7 +595,7 @@ def main():
     print("🚀 Starting Comet Browser History Extraction")
     print("=" * 50)
     
-    extractor = HistoryExtractor(args.db_path)
+    extractor = HistoryExtractor(args.db_path, include_visits=not args.csv_only)
     
     # Extract data
     if not extractor.extract_data():
@@ -536,16 +627,14 @@ def main():
             max_tokens = ChunkingHelper.parse_chunk_size(args.chunk_size)
             print(f"🔄 Chunking data into {max_tokens:,} token chunks...")
             
-            # Estimate total tokens for all data
-            total_estimated_tokens = sum(
-                ChunkingHelper.estimate_tokens(asdict(entry)) 
-                for entry in extractor.history_entries
-            )
-            print(f"📊 Estimated total tokens: {total_estimated_tokens:,}")
-            
             # Create chunks
             chunks = extractor.chunk_history(max_tokens)
             
+            # Estimate total tokens for all data from the per-chunk estimates, so
+            # each entry is only serialized once for estimation (in chunk_history)
+            total_estimated_tokens = sum(metadata["estimated_tokens"] for _, metadata in chunks)
+            print(f"📊 Estimated total tokens: {total_estimated_tokens:,}")
+            
             if not chunks:
                 print("❌ No data to chunk")
                 sys.exit(1)
@@ -562,25 +651,44 @@ def main():
         except ValueError as e:
             print(f"❌ Error with chunk size: {e}")
             sys.exit(1)
+    elif args.csv_only:
+        print("📄 Saving CSV and statistics only (no visit details)...")
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            csv_saved = executor.submit(extractor.save_to_csv, "comet_history_summary.csv")
+            statistics_saved = executor.submit(extractor.save_statistics, summary,
+                                               "comet_history_statistics.json")
+        
+        if csv_saved.result():
+            print("✅ Summary CSV saved")
+        if statistics_saved.result():
+            print("✅ Statistics saved")
+        
+        print("\n🎉 Extraction completed successfully!")
+        print("\nFiles created:")
+        print("  📊 comet_history_summary.csv - Quick overview")
+        print("  📈 comet_history_statistics.json - Summary statistics")
     else:
         # Original behavior - single file output
         print("📄 Saving as single file (no chunking)...")
         
-        # Save JSON (comprehensive format for AI processing)
-        if extractor.save_to_json("comet_history_complete.json"):
-            print("✅ Comprehensive JSON saved")
+        # The three files are independent and only read the extracted entries,
+        # so write them concurrently; file writes release the GIL
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Save JSON (comprehensive format for AI processing)
+            json_saved = executor.submit(extractor.save_to_json, "comet_history_complete.json", summary)
+            # Save CSV (simplified format for quick review)
+            csv_saved = executor.submit(extractor.save_to_csv, "comet_history_summary.csv")
+            # Save summary statistics
+            statistics_saved = executor.submit(extractor.save_statistics, summary,
+                                               "comet_history_statistics.json")
         
-        # Save CSV (simplified format for quick review)  
-        if extractor.save_to_csv("comet_history_summary.csv"):
+        if json_saved.result():
+            print("✅ Comprehensive JSON saved")
+        if csv_saved.result():
             print("✅ Summary CSV saved")
-        
-        # Save summary statistics
-        try:
-            with open("comet_history_statistics.json", 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+        if statistics_saved.result():
             print("✅ Statistics saved")
-        except Exception as e:
-            print(f"❌ Error saving statistics: {e}")
         
         print("\n🎉 Extraction completed successfully!")
         print("\nFiles created:")